@@ -1,5 +1,6 @@
 import os
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
 
 def create_app(test_config=None):
     app = Flask(__name__, instance_relative_config=True)
@@ -17,6 +18,13 @@ def create_app(test_config=None):
         # テスト用設定を上書き
         app.config.from_mapping(test_config)
 
+    # 本番環境ではテンプレートのバイトコードをキャッシュし、再読み込みを無効化
+    if app.config["ENV"] != "development":
+        jinja_cache_dir = os.path.join(app.instance_path, "jinja_cache")
+        os.makedirs(jinja_cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
+        app.jinja_env.auto_reload = False
+
     from .views.greeting import greeting
 
     app.register_blueprint(greeting, url_prefix="/greeting")
@@ -1,12 +1,34 @@
 import re
+from functools import lru_cache
 
 from flask import render_template
 from flask import redirect
 from flask import flash
 from flask.views import MethodView
 
+# Kept for code that imports it; View.register() uses _camel_to_snake().
 camel_to_underscore = re.compile('((?<=[a-z0-9])[A-Z]|(?!^)[A-Z](?=[a-z]))')
 
+_UPPER = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_LOWER = frozenset('abcdefghijklmnopqrstuvwxyz')
+_LOWER_OR_DIGIT = _LOWER | frozenset('0123456789')
+
+
+@lru_cache(maxsize=None)
+def _camel_to_snake(name):
+    """
+    Convert 'ViewName' to 'view_name'. Cached since class names are constant.
+    Same result as camel_to_underscore, but in a single pass without re.
+    """
+    out = []
+    last = len(name) - 1
+    for i, c in enumerate(name):
+        if c in _UPPER and i and (name[i - 1] in _LOWER_OR_DIGIT or
+                                  (i < last and name[i + 1] in _LOWER)):
+            out.append('_')
+        out.append(c)
+    return ''.join(out).lower()
+
 
 class ImproperlyConfigured(NotImplementedError):
     pass
@@ -14,6 +36,16 @@ class ImproperlyConfigured(NotImplementedError):
 
 class FlashMessageMixin:
     success_message = None
+    _default_success_message = True
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Remember whether get_success_message() is overwritten, so the
+        success_message variable can be read directly when it isn't.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._default_success_message = (
+            cls.get_success_message is FlashMessageMixin.get_success_message)
 
     def get_success_message(self):
         """
@@ -25,7 +57,12 @@ class FlashMessageMixin:
         """
         Flash the success message if it's not empty.
         """
-        self.flash_message('success', self.get_success_message())
+        if self._default_success_message:
+            message = self.success_message
+        else:
+            message = self.get_success_message()
+        if message:
+            self.flash_message('success', message)
 
     def flash_message(self, category, message):
         """
@@ -51,7 +88,7 @@ class View(MethodView):
         """
         if name is None:
             # Convert 'ViewName' to 'view_name' and use it
-            name = camel_to_underscore.sub(r'_\1', cls.__name__).lower()
+            name = _camel_to_snake(cls.__name__)
         blueprint.add_url_rule(route, view_func=cls.as_view(name))
 
     def dispatch(self):
@@ -84,6 +121,19 @@ class TemplateView(View):
     A view that will simply display a template with the given context.
     """
     template_name = None
+    _context_items = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Collect the `_context_item` of every class in the MRO, base classes
+        first, so get_default_context() can build the context in one go
+        instead of walking a super() chain.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._context_items = tuple(
+            klass.__dict__['_context_item'] for klass in reversed(cls.__mro__)
+            if '_context_item' in klass.__dict__
+        )
 
     def get_template_names(self):
         """
@@ -98,13 +148,17 @@ class TemplateView(View):
     def get_default_context(self):
         """
         Get the default context, which contains this view instance along with
-        the kwargs.
+        the kwargs, plus the `(name, value)` pair of each `_context_item`
+        declared by the view classes (object list, object, form...).
         """
         context = {
             'view': self,
             'kwargs': self.kwargs,
         }
         context.update(self.get_context())
+        for item in self._context_items:
+            name, value = item(self)
+            context[name] = value
         return context
 
     def get_context(self):
@@ -113,13 +167,19 @@ class TemplateView(View):
         """
         return {}
 
-    def get(self, *args, **kwargs):
+    def render(self):
         """
-        Simply render the template with the context.
+        Render the template with the default context.
         """
         return render_template(self.get_template_names(),
                                **self.get_default_context())
 
+    def get(self, *args, **kwargs):
+        """
+        Simply render the template with the context.
+        """
+        return self.render()
+
 
 class RedirectView(FlashMessageMixin, View):
     """
@@ -169,13 +229,11 @@ class ListView(TemplateView):
             raise ImproperlyConfigured(error % self.__class__.__name__)
         return self.model.query.all()
 
-    def get_default_context(self):
+    def _context_item(self):
         """
         Add the object list to the context.
         """
-        context = super().get_default_context()
-        context[self.get_context_object_list_name()] = self.get_object_list()
-        return context
+        return self.get_context_object_list_name(), self.get_object_list()
 
 
 class DetailView(TemplateView):
@@ -198,20 +256,37 @@ class DetailView(TemplateView):
         error = "%s must define `get_object()`"
         raise ImproperlyConfigured(error % self.__class__.__name__)
 
-    def get_default_context(self):
+    def dispatch_request(self, *args, **kwargs):
+        """
+        Forget the object cached by a previous request, in case the view
+        instance is reused (init_every_request = False).
+        """
+        self.__dict__.pop('_object_cache', None)
+        return super().dispatch_request(*args, **kwargs)
+
+    def _cached_object(self):
+        """
+        Call get_object() once per request and reuse the result, since the
+        form, the context and get() all need the same object.
+        """
+        try:
+            return self._object_cache
+        except AttributeError:
+            self._object_cache = self.get_object()
+            return self._object_cache
+
+    def _context_item(self):
         """
         Add the object to the context.
         """
-        context = super().get_default_context()
-        context[self.get_context_object_name()] = self.get_object()
-        return context
+        return self.get_context_object_name(), self._cached_object()
 
     def get(self, *args, **kwargs):
         """
         Set the object to an instance variable, then process as normal.
         """
-        self.object = self.get_object()
-        return super().get(*args, **kwargs)
+        self.object = self._cached_object()
+        return super().get()
 
 
 class FormView(FlashMessageMixin, TemplateView):
@@ -238,13 +313,11 @@ class FormView(FlashMessageMixin, TemplateView):
         """
         return self.context_form_name
 
-    def get_default_context(self):
+    def _context_item(self):
         """
         Add the form to the context.
         """
-        context = super().get_default_context()
-        context[self.get_context_form_name()] = self.form
-        return context
+        return self.get_context_form_name(), self.form
 
     def get_form(self):
         """
@@ -274,16 +347,17 @@ class FormView(FlashMessageMixin, TemplateView):
 
     def form_invalid_process(self):
         """
-        Form is invalid so show it again using get().
+        Form is invalid so render it again. The bound form and any object are
+        already set, so this skips get() and renders directly.
         """
-        return super().get(*self.args, **self.kwargs)
+        return self.render()
 
     def get(self, *args, **kwargs):
         """
         Set the form to an instance variable, then process as normal.
         """
         self.form = self.get_form()
-        return super().get(*args, **kwargs)
+        return super().get()
 
     def post(self, *args, **kwargs):
         """
@@ -299,7 +373,7 @@ class FormView(FlashMessageMixin, TemplateView):
             return self.form_valid() or self.form_valid_process()
         # If form_invalid() returns a result, use it.
         # This means subclass has custom functionality it wants to use.
-        # Otherwise just show the form again using get().
+        # Otherwise just show the form again.
         return self.form_invalid() or self.form_invalid_process()
 
 
@@ -310,9 +384,11 @@ class CreateView(FormView, DetailView):
 
     def get_form(self):
         """
-        Return the form instance with obj set.
+        Return the form instance with obj set. The object is kept as an
+        instance variable so it isn't fetched again when rendering.
         """
-        return self.form_class(obj=self.get_object())
+        self.object = self._cached_object()
+        return self.form_class(obj=self.object)
 
     def get_db_session(self):
         """
@@ -346,9 +422,11 @@ class DeleteView(FormView, DetailView):
 
     def get_form(self):
         """
-        Return the form instance with obj set.
+        Return the form instance with obj set. The object is kept as an
+        instance variable so it isn't fetched again when rendering.
         """
-        return self.form_class(obj=self.get_object())
+        self.object = self._cached_object()
+        return self.form_class(obj=self.object)
 
     def get_db_session(self):
         """
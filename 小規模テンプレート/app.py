@@ -1,5 +1,6 @@
 import os
 from flask import Flask, request, render_template
+from jinja2 import FileSystemBytecodeCache
 
 app = Flask(__name__, instance_relative_config=True)
 
@@ -12,6 +13,16 @@ if app.config["ENV"] == "development":
 else:
     app.config.from_pyfile(os.path.join("config", "production.py"), silent=True)
 
+# 本番環境ではテンプレートのバイトコードをキャッシュし、再読み込みを無効化
+# さらにテンプレートは起動時に一度だけコンパイルして使い回す
+greeting_template = None
+if app.config["ENV"] != "development":
+    jinja_cache_dir = os.path.join(app.instance_path, "jinja_cache")
+    os.makedirs(jinja_cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
+    app.jinja_env.auto_reload = False
+    greeting_template = app.jinja_env.get_template("greeting.html")
+
 @app.route("/", methods=("GET", "POST"))
 @app.route("/<string:greeting>", methods=("GET", "POST"))
 def greeting_user(greeting="Hello"):
@@ -20,4 +31,10 @@ def greeting_user(greeting="Hello"):
     else:
         user_name = request.args.get("user_name", "")
 
-    return render_template("greeting.html", greeting=greeting, user_name=user_name)
\ No newline at end of file
+    context = {"greeting": greeting, "user_name": user_name}
+    if greeting_template is None:
+        return render_template("greeting.html", **context)
+
+    # render_template() と同様にコンテキストプロセッサの値を追加する
+    app.update_template_context(context)
+    return greeting_template.render(context)
\ No newline at end of file